@@ -1,5 +1,8 @@
 from typing import Generator
+from fastapi import Depends, HTTPException
+from sqlalchemy.orm import Session
 from app.db.session import SessionLocal
+from app.models.program import Program
 
 def get_db() -> Generator:
     db = SessionLocal()
@@ -7,3 +10,9 @@ def get_db() -> Generator:
         yield db
     finally:
         db.close()
+
+def get_program(program_id: int, db: Session = Depends(get_db)) -> Program:
+    program = db.get(Program, program_id)
+    if program is None:
+        raise HTTPException(status_code=404, detail="Program not found")
+    return program
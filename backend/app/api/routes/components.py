@@ -3,36 +3,65 @@ from __future__ import annotations
 from typing import Optional, List, Dict, Any
 from io import BytesIO
 import openpyxl
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional: pip install .[columnar]
+    pa = None
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import select
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_program
+from app.core.admission import export_limiter, reports_limiter, tree_limiter
+from app.core.events import publish_event
+from app.core.negotiation import choose_media_type
+from app.db.tree import where_used_cte
 from app.models.component import Component
+from app.models.program import Program
 from app.models.subsystem import Subsystem
 from app.schemas.component import ComponentCreate, ComponentOut, ComponentUpdate, ComponentTree
+from app.schemas.report import WhereUsed
+from app.schemas.subsystem import SubsystemOut
 
 router = APIRouter()
 
+def _get_in_program(db: Session, model, obj_id: int, program_id: int):
+    obj = db.get(model, obj_id)
+    if obj is None or obj.program_id != program_id:
+        return None
+    return obj
+
+def _event_data(comp: Component) -> Dict[str, Any]:
+    # Compact: clients resolve the subsystem from subsystem_id
+    return ComponentOut.model_validate(comp).model_dump(mode="json", exclude={"subsystem"})
+
 @router.post("", response_model=ComponentOut, status_code=201)
-def create_component(payload: ComponentCreate, db: Session = Depends(get_db)) -> Component:
-    # Optional parent existence check
+def create_component(
+    payload: ComponentCreate,
+    program: Program = Depends(get_program),
+    db: Session = Depends(get_db),
+) -> Component:
+    # Optional parent existence check (parents and subsystems must be in the same program)
     if payload.parent_id is not None:
-        parent = db.get(Component, payload.parent_id)
+        parent = _get_in_program(db, Component, payload.parent_id, program.id)
         if parent is None:
             raise HTTPException(status_code=404, detail="parent_id not found")
 
     if payload.subsystem_id is not None:
-        subsystem = db.get(Subsystem, payload.subsystem_id)
+        subsystem = _get_in_program(db, Subsystem, payload.subsystem_id, program.id)
         if subsystem is None:
             raise HTTPException(status_code=404, detail="subsystem_id not found")
 
-    existing = db.execute(select(Component).where(Component.name == payload.name)).scalar_one_or_none()
+    existing = db.execute(
+        select(Component).where(Component.program_id == program.id, Component.name == payload.name)
+    ).scalar_one_or_none()
     if existing:
         raise HTTPException(status_code=409, detail="Component name already exists")
 
     comp = Component(
+        program_id=program.id,
         name=payload.name,
         part_number=payload.part_number,
         wbs=payload.wbs,
@@ -44,24 +73,128 @@ def create_component(payload: ComponentCreate, db: Session = Depends(get_db)) ->
         subsystem_id=payload.subsystem_id,
     )
     db.add(comp)
+    db.flush()
+    publish_event(db, "component.created", program.id, _event_data(comp))
     db.commit()
     db.refresh(comp)
     return comp
 
-@router.get("", response_model=List[ComponentOut])
+JSON_MEDIA_TYPE = "application/json"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
+# Flat columns for columnar output (subsystem is denormalized to its name)
+_COLUMNAR_FIELDS = [
+    ("id", Component.id),
+    ("name", Component.name),
+    ("part_number", Component.part_number),
+    ("wbs", Component.wbs),
+    ("make_buy", Component.make_buy),
+    ("mass_kg", Component.mass_kg),
+    ("cost_usd", Component.cost_usd),
+    ("quantity", Component.quantity),
+    ("parent_id", Component.parent_id),
+    ("subsystem_id", Component.subsystem_id),
+    ("subsystem", Subsystem.name),
+]
+
+# Columnar output is only offered when pyarrow is installed
+_LIST_MEDIA_TYPES = [JSON_MEDIA_TYPE] + ([ARROW_STREAM_MEDIA_TYPE, PARQUET_MEDIA_TYPE] if pa is not None else [])
+
+def _columnar_response(db: Session, program_id: int, roots_only: bool, media_type: str) -> Response:
+    stmt = (
+        select(*(col for _, col in _COLUMNAR_FIELDS))
+        .outerjoin(Subsystem, Component.subsystem_id == Subsystem.id)
+        .where(Component.program_id == program_id)
+        .order_by(Component.id)
+    )
+    if roots_only:
+        stmt = stmt.where(Component.parent_id.is_(None))
+
+    # Plain row tuples (no ORM objects), transposed into one tuple per column
+    rows = db.execute(stmt).all()
+    columns = list(zip(*rows)) if rows else [()] * len(_COLUMNAR_FIELDS)
+
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("name", pa.string()),
+        ("part_number", pa.string()),
+        ("wbs", pa.string()),
+        ("make_buy", pa.string()),
+        ("mass_kg", pa.float64()),
+        ("cost_usd", pa.float64()),
+        ("quantity", pa.int64()),
+        ("parent_id", pa.int64()),
+        ("subsystem_id", pa.int64()),
+        ("subsystem", pa.string()),
+    ])
+    arrays = [
+        pa.array([float(v) for v in col], type=field.type) if pa.types.is_floating(field.type)
+        else pa.array(col, type=field.type)
+        for col, field in zip(columns, schema)
+    ]
+    table = pa.Table.from_arrays(arrays, schema=schema)
+
+    sink = pa.BufferOutputStream()
+    if media_type == PARQUET_MEDIA_TYPE:
+        import pyarrow.parquet as pq
+        pq.write_table(table, sink)
+    else:
+        with pa.ipc.new_stream(sink, schema) as writer:
+            writer.write_table(table)
+    return Response(content=sink.getvalue().to_pybytes(), media_type=media_type, headers={"Vary": "Accept"})
+
+@router.get(
+    "",
+    response_model=List[ComponentOut],
+    responses={
+        200: {
+            "content": {
+                ARROW_STREAM_MEDIA_TYPE: {},
+                PARQUET_MEDIA_TYPE: {},
+            },
+            "description": "JSON by default; Arrow IPC stream or Parquet when requested via Accept",
+        }
+    },
+)
 def list_components(
+    response: Response,
     roots_only: bool = Query(False, description="If true, only return components with no parent"),
+    accept: Optional[str] = Header(None),
+    program: Program = Depends(get_program),
     db: Session = Depends(get_db),
-) -> List[Component]:
-    stmt = select(Component).options(joinedload(Component.subsystem))
+):
+    media_type = choose_media_type(accept, _LIST_MEDIA_TYPES)
+    if media_type is None:
+        raise HTTPException(
+            status_code=406,
+            detail=f"Acceptable media types: {', '.join(_LIST_MEDIA_TYPES)}",
+            headers={"Vary": "Accept"},
+        )
+    if media_type != JSON_MEDIA_TYPE:
+        return _columnar_response(db, program.id, roots_only, media_type)
+
+    # The representation depends on Accept, so shared caches must key on it
+    response.headers["Vary"] = "Accept"
+
+    stmt = (
+        select(Component)
+        .options(joinedload(Component.subsystem))
+        .where(Component.program_id == program.id)
+    )
     if roots_only:
         stmt = stmt.where(Component.parent_id.is_(None))
     return list(db.execute(stmt.order_by(Component.id)).scalars().all())
 
-@router.get("/export/excel")
-def export_components_excel(db: Session = Depends(get_db)):
-    # Fetch all components
-    components = db.execute(select(Component).options(joinedload(Component.subsystem)).order_by(Component.id)).scalars().all()
+@router.get("/export/excel", dependencies=[Depends(export_limiter)])
+def export_components_excel(program: Program = Depends(get_program), db: Session = Depends(get_db)):
+    # Fetch all components of this program
+    components = db.execute(
+        select(Component)
+        .options(joinedload(Component.subsystem))
+        .where(Component.program_id == program.id)
+        .order_by(Component.id)
+    ).scalars().all()
     
     # Sort hierarchically (similar to frontend logic)
     # 1. Build adjacency list
@@ -160,56 +293,95 @@ def export_components_excel(db: Session = Depends(get_db)):
     buffer.seek(0)
     
     headers = {
-        'Content-Disposition': 'attachment; filename="components.xlsx"'
+        'Content-Disposition': f'attachment; filename="components-{program.id}.xlsx"'
     }
     
     return StreamingResponse(buffer, media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', headers=headers)
 
+@router.get("/where-used", response_model=List[WhereUsed], dependencies=[Depends(reports_limiter)])
+def where_used(
+    part_number: str = Query(..., min_length=1, max_length=50),
+    program: Program = Depends(get_program),
+    db: Session = Depends(get_db),
+):
+    """Every assembly path a part number appears on, root first."""
+    walk = where_used_cte(program.id, part_number)
+    stmt = (
+        select(
+            walk.c.component_id,
+            walk.c.name,
+            walk.c.part_number,
+            walk.c.quantity,
+            walk.c.effective_quantity,
+            walk.c.path_ids,
+            walk.c.path_names.label("path"),
+        )
+        .where(walk.c.parent_id.is_(None))
+        .order_by(walk.c.path_ids)
+    )
+    return [WhereUsed.model_validate(row, from_attributes=True) for row in db.execute(stmt).all()]
+
 @router.get("/{component_id}", response_model=ComponentOut)
-def get_component(component_id: int, db: Session = Depends(get_db)) -> Component:
+def get_component(component_id: int, program: Program = Depends(get_program), db: Session = Depends(get_db)) -> Component:
     comp = db.execute(
         select(Component)
         .options(joinedload(Component.subsystem))
-        .where(Component.id == component_id)
+        .where(Component.id == component_id, Component.program_id == program.id)
     ).scalar_one_or_none()
     if comp is None:
         raise HTTPException(status_code=404, detail="Component not found")
     return comp
 
 @router.patch("/{component_id}", response_model=ComponentOut)
-def update_component(component_id: int, payload: ComponentUpdate, db: Session = Depends(get_db)) -> Component:
-    comp = db.get(Component, component_id)
+def update_component(
+    component_id: int,
+    payload: ComponentUpdate,
+    program: Program = Depends(get_program),
+    db: Session = Depends(get_db),
+) -> Component:
+    comp = _get_in_program(db, Component, component_id, program.id)
     if comp is None:
         raise HTTPException(status_code=404, detail="Component not found")
 
     if payload.parent_id is not None:
         if payload.parent_id == component_id:
             raise HTTPException(status_code=400, detail="Component cannot be its own parent")
-        parent = db.get(Component, payload.parent_id)
+        parent = _get_in_program(db, Component, payload.parent_id, program.id)
         if parent is None:
             raise HTTPException(status_code=404, detail="parent_id not found")
 
     if payload.subsystem_id is not None:
-        subsystem = db.get(Subsystem, payload.subsystem_id)
+        subsystem = _get_in_program(db, Subsystem, payload.subsystem_id, program.id)
         if subsystem is None:
             raise HTTPException(status_code=404, detail="subsystem_id not found")
 
+    if payload.name is not None and payload.name != comp.name:
+        existing = db.execute(
+            select(Component).where(Component.program_id == program.id, Component.name == payload.name)
+        ).scalar_one_or_none()
+        if existing:
+            raise HTTPException(status_code=409, detail="Component name already exists")
+
     # Apply partial updates
     data = payload.model_dump(exclude_unset=True)
     for k, v in data.items():
         setattr(comp, k, v)
 
+    db.flush()
+    publish_event(db, "component.updated", program.id, _event_data(comp))
     db.commit()
     db.refresh(comp)
     return comp
 
 @router.delete("/{component_id}", status_code=204)
-def delete_component(component_id: int, db: Session = Depends(get_db)):
-    comp = db.get(Component, component_id)
+def delete_component(component_id: int, program: Program = Depends(get_program), db: Session = Depends(get_db)):
+    comp = _get_in_program(db, Component, component_id, program.id)
     if comp is None:
         raise HTTPException(status_code=404, detail="Component not found")
     
     db.delete(comp)
+    # Children are re-parented to NULL by the FK, clients mirror that
+    publish_event(db, "component.deleted", program.id, {"id": component_id})
     db.commit()
     return Response(status_code=204)
 
@@ -232,10 +404,12 @@ def _build_tree(all_components: List[Component]) -> List[ComponentTree]:
 
     return roots
 
-@router.get("/{component_id}/tree", response_model=ComponentTree)
-def get_subtree(component_id: int, db: Session = Depends(get_db)) -> ComponentTree:
-    # For simplicity (learning), load all and build in memory.
-    all_components = list(db.execute(select(Component)).scalars().all())
+@router.get("/{component_id}/tree", response_model=ComponentTree, dependencies=[Depends(tree_limiter)])
+def get_subtree(component_id: int, program: Program = Depends(get_program), db: Session = Depends(get_db)) -> ComponentTree:
+    # For simplicity (learning), load the whole program and build in memory.
+    all_components = list(db.execute(
+        select(Component).where(Component.program_id == program.id)
+    ).scalars().all())
     node_map: Dict[int, ComponentTree] = {}
     for c in all_components:
         node_map[c.id] = ComponentTree.model_validate(c, from_attributes=True)
@@ -251,7 +425,7 @@ def get_subtree(component_id: int, db: Session = Depends(get_db)) -> ComponentTr
     return node_map[component_id]
 
 @router.post("/seed", response_model=List[ComponentOut])
-def seed_example(db: Session = Depends(get_db)) -> List[Component]:
+def seed_example(program: Program = Depends(get_program), db: Session = Depends(get_db)) -> List[Component]:
     """
     Creates a simple hierarchy:
       Battery Assembly
@@ -261,36 +435,52 @@ def seed_example(db: Session = Depends(get_db)) -> List[Component]:
 
     Plus a Solar Array with panels as children.
     """
-    # Avoid double-seeding: if exists, return current list
-    existing = db.execute(select(Component).limit(1)).scalar_one_or_none()
+    # Avoid double-seeding: if the program has components, return current list
+    existing = db.execute(select(Component).where(Component.program_id == program.id).limit(1)).scalar_one_or_none()
     if existing:
-        return list(db.execute(select(Component).options(joinedload(Component.subsystem)).order_by(Component.id)).scalars().all())
+        return list(db.execute(
+            select(Component)
+            .options(joinedload(Component.subsystem))
+            .where(Component.program_id == program.id)
+            .order_by(Component.id)
+        ).scalars().all())
 
     # Create subsystems
-    eps = Subsystem(name="EPS")
-    struc = Subsystem(name="Structures")
+    eps = Subsystem(program_id=program.id, name="EPS")
+    struc = Subsystem(program_id=program.id, name="Structures")
     db.add_all([eps, struc])
     db.flush()
 
-    battery_assembly = Component(name="Battery Assembly", mass_kg=12.5, cost_usd=25000, quantity=1, parent_id=None, subsystem_id=eps.id)
+    battery_assembly = Component(program_id=program.id, name="Battery Assembly", mass_kg=12.5, cost_usd=25000, quantity=1, parent_id=None, subsystem_id=eps.id)
     db.add(battery_assembly)
     db.flush()
 
-    li_ion_battery = Component(name="Li-Ion Battery", mass_kg=10.0, cost_usd=18000, quantity=1, parent_id=battery_assembly.id, subsystem_id=eps.id)
-    battery_bracket = Component(name="Battery Bracket", mass_kg=2.5, cost_usd=7000, quantity=1, parent_id=battery_assembly.id, subsystem_id=struc.id)
+    li_ion_battery = Component(program_id=program.id, name="Li-Ion Battery", mass_kg=10.0, cost_usd=18000, quantity=1, parent_id=battery_assembly.id, subsystem_id=eps.id)
+    battery_bracket = Component(program_id=program.id, name="Battery Bracket", mass_kg=2.5, cost_usd=7000, quantity=1, parent_id=battery_assembly.id, subsystem_id=struc.id)
     db.add_all([li_ion_battery, battery_bracket])
     db.flush()
 
-    li_ion_cell = Component(name="Li-Ion Cell", mass_kg=0.045, cost_usd=35, quantity=200, parent_id=li_ion_battery.id, subsystem_id=eps.id)
+    li_ion_cell = Component(program_id=program.id, name="Li-Ion Cell", mass_kg=0.045, cost_usd=35, quantity=200, parent_id=li_ion_battery.id, subsystem_id=eps.id)
     db.add(li_ion_cell)
 
-    solar_array = Component(name="Solar Array", mass_kg=25.0, cost_usd=90000, quantity=1, parent_id=None, subsystem_id=eps.id)
+    solar_array = Component(program_id=program.id, name="Solar Array", mass_kg=25.0, cost_usd=90000, quantity=1, parent_id=None, subsystem_id=eps.id)
     db.add(solar_array)
     db.flush()
 
-    panel = Component(name="Solar Panel", mass_kg=2.0, cost_usd=5000, quantity=8, parent_id=solar_array.id, subsystem_id=eps.id)
-    harness = Component(name="Array Harness", mass_kg=1.2, cost_usd=1500, quantity=1, parent_id=solar_array.id, subsystem_id=eps.id)
+    panel = Component(program_id=program.id, name="Solar Panel", mass_kg=2.0, cost_usd=5000, quantity=8, parent_id=solar_array.id, subsystem_id=eps.id)
+    harness = Component(program_id=program.id, name="Array Harness", mass_kg=1.2, cost_usd=1500, quantity=1, parent_id=solar_array.id, subsystem_id=eps.id)
     db.add_all([panel, harness])
+    db.flush()
+
+    for sub in (eps, struc):
+        publish_event(db, "subsystem.created", program.id, SubsystemOut.model_validate(sub).model_dump(mode="json"))
+    for comp in (battery_assembly, li_ion_battery, battery_bracket, li_ion_cell, solar_array, panel, harness):
+        publish_event(db, "component.created", program.id, _event_data(comp))
 
     db.commit()
-    return list(db.execute(select(Component).options(joinedload(Component.subsystem)).order_by(Component.id)).scalars().all())
+    return list(db.execute(
+        select(Component)
+        .options(joinedload(Component.subsystem))
+        .where(Component.program_id == program.id)
+        .order_by(Component.id)
+    ).scalars().all())
@@ -0,0 +1,57 @@
+import asyncio
+import json
+from typing import Any, AsyncGenerator, Dict, Optional
+from fastapi import APIRouter, Header, Query
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.core.events import broker
+
+router = APIRouter()
+
+def _format(event: Dict[str, Any]) -> str:
+    data = json.dumps({"program_id": event["program_id"], **event["data"]})
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+@router.get("")
+async def stream_events(
+    program_id: Optional[int] = Query(None, description="Only send events for this program"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Server-sent events for component and subsystem changes.
+
+    Event types: component.created / component.updated / component.deleted,
+    subsystem.created / subsystem.deleted, program.deleted (its components and
+    subsystems are gone too), and `reset` when the stream can't resume from
+    Last-Event-ID (the client should refetch).
+    """
+    sub, backlog = broker.subscribe(program_id, last_event_id)
+
+    async def event_stream() -> AsyncGenerator[str, None]:
+        try:
+            yield "retry: 3000\n\n"
+            if backlog is None:
+                yield "event: reset\ndata: {}\n\n"
+            else:
+                for event in backlog:
+                    yield _format(event)
+
+            while not broker.shutdown.is_set():
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=settings.events_keepalive_s)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event is None:
+                    # Dropped by the broker or shutting down; the client reconnects and resumes
+                    return
+                yield _format(event)
+        finally:
+            broker.unsubscribe(sub)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
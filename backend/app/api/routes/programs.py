@@ -0,0 +1,38 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+
+from app.api.deps import get_db, get_program
+from app.core.events import publish_event
+from app.models.program import Program
+from app.schemas.program import ProgramCreate, ProgramOut
+
+router = APIRouter()
+
+@router.post("", response_model=ProgramOut, status_code=201)
+def create_program(payload: ProgramCreate, db: Session = Depends(get_db)):
+    existing = db.execute(select(Program).where(Program.name == payload.name)).scalar_one_or_none()
+    if existing:
+        raise HTTPException(status_code=409, detail="Program name already exists")
+
+    program = Program(name=payload.name)
+    db.add(program)
+    db.commit()
+    db.refresh(program)
+    return program
+
+@router.get("", response_model=List[ProgramOut])
+def list_programs(db: Session = Depends(get_db)):
+    return list(db.execute(select(Program).order_by(Program.name)).scalars().all())
+
+@router.get("/{program_id}", response_model=ProgramOut)
+def get_program_by_id(program: Program = Depends(get_program)):
+    return program
+
+@router.delete("/{program_id}", status_code=204)
+def delete_program(program: Program = Depends(get_program), db: Session = Depends(get_db)):
+    # Components and subsystems go with it (ON DELETE CASCADE), so no per-row events
+    publish_event(db, "program.deleted", program.id, {"id": program.id})
+    db.delete(program)
+    db.commit()
@@ -0,0 +1,28 @@
+from typing import List
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+
+from app.api.deps import get_db, get_program
+from app.core.admission import reports_limiter
+from app.db.tree import assembly_paths_cte
+from app.models.program import Program
+from app.schemas.report import PartUsage
+
+router = APIRouter()
+
+@router.get("/parts", response_model=List[PartUsage], dependencies=[Depends(reports_limiter)])
+def parts_report(program: Program = Depends(get_program), db: Session = Depends(get_db)):
+    """Total effective quantity per part_number across the program's assembly tree."""
+    paths = assembly_paths_cte(program.id)
+    stmt = (
+        select(
+            paths.c.part_number,
+            func.sum(paths.c.effective_quantity).label("total_quantity"),
+            func.count().label("component_count"),
+        )
+        .where(paths.c.part_number.is_not(None))
+        .group_by(paths.c.part_number)
+        .order_by(paths.c.part_number)
+    )
+    return [PartUsage.model_validate(row, from_attributes=True) for row in db.execute(stmt).all()]
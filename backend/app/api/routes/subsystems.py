@@ -3,35 +3,42 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
-from app.api.deps import get_db
+from app.api.deps import get_db, get_program
+from app.core.events import publish_event
+from app.models.program import Program
 from app.models.subsystem import Subsystem
 from app.schemas.subsystem import SubsystemCreate, SubsystemOut
 
 router = APIRouter()
 
 @router.post("", response_model=SubsystemOut, status_code=201)
-def create_subsystem(payload: SubsystemCreate, db: Session = Depends(get_db)):
-    existing = db.execute(select(Subsystem).where(Subsystem.name == payload.name)).scalar_one_or_none()
+def create_subsystem(payload: SubsystemCreate, program: Program = Depends(get_program), db: Session = Depends(get_db)):
+    existing = db.execute(
+        select(Subsystem).where(Subsystem.program_id == program.id, Subsystem.name == payload.name)
+    ).scalar_one_or_none()
     if existing:
         raise HTTPException(status_code=409, detail="Subsystem name already exists")
     
-    sub = Subsystem(name=payload.name)
+    sub = Subsystem(program_id=program.id, name=payload.name)
     db.add(sub)
+    db.flush()
+    publish_event(db, "subsystem.created", program.id, SubsystemOut.model_validate(sub).model_dump(mode="json"))
     db.commit()
     db.refresh(sub)
     return sub
 
 @router.get("", response_model=List[SubsystemOut])
-def list_subsystems(db: Session = Depends(get_db)):
-    return list(db.execute(select(Subsystem).order_by(Subsystem.name)).scalars().all())
+def list_subsystems(program: Program = Depends(get_program), db: Session = Depends(get_db)):
+    return list(db.execute(
+        select(Subsystem).where(Subsystem.program_id == program.id).order_by(Subsystem.name)
+    ).scalars().all())
 
 @router.delete("/{subsystem_id}", status_code=204)
-def delete_subsystem(subsystem_id: int, db: Session = Depends(get_db)):
+def delete_subsystem(subsystem_id: int, program: Program = Depends(get_program), db: Session = Depends(get_db)):
     sub = db.get(Subsystem, subsystem_id)
-    if not sub:
+    if not sub or sub.program_id != program.id:
         raise HTTPException(status_code=404, detail="Subsystem not found")
     
     db.delete(sub)
+    publish_event(db, "subsystem.deleted", program.id, {"id": subsystem_id})
     db.commit()
-
-
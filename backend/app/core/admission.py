@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncGenerator, Dict
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+
+
+class ConcurrencyLimiter:
+    """
+    Per-route admission control.
+
+    At most `max_concurrency` requests run at once; up to `max_queue` more may
+    wait (for at most `queue_timeout_s`) for a free slot. Anything beyond that
+    is rejected immediately with 503 + Retry-After, so expensive endpoints
+    can't tie up the whole threadpool / connection pool.
+
+    Used as an async dependency, so waiting happens on the event loop rather
+    than in a worker thread, and before `get_db` checks out a connection.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout_s: float,
+        retry_after_s: int,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout_s = queue_timeout_s
+        self.retry_after_s = retry_after_s
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+
+    def _reject(self) -> HTTPException:
+        return HTTPException(
+            status_code=503,
+            detail=f"Too many concurrent '{self.name}' requests, retry later",
+            headers={"Retry-After": str(self.retry_after_s)},
+        )
+
+    async def acquire(self) -> None:
+        # Fast path: a slot is free and nobody is queued ahead of us
+        if not self._semaphore.locked() and self.waiting == 0:
+            await self._semaphore.acquire()
+            self.in_flight += 1
+            return
+
+        if self.waiting >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise self._reject()
+
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), timeout=self.queue_timeout_s)
+        except asyncio.TimeoutError:
+            self.rejected_timeout += 1
+            raise self._reject()
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    async def __call__(self) -> AsyncGenerator[None, None]:
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+        }
+
+
+export_limiter = ConcurrencyLimiter(
+    "export",
+    max_concurrency=settings.export_max_concurrency,
+    max_queue=settings.export_max_queue,
+    queue_timeout_s=settings.admission_queue_timeout_s,
+    retry_after_s=settings.admission_retry_after_s,
+)
+
+tree_limiter = ConcurrencyLimiter(
+    "tree",
+    max_concurrency=settings.tree_max_concurrency,
+    max_queue=settings.tree_max_queue,
+    queue_timeout_s=settings.admission_queue_timeout_s,
+    retry_after_s=settings.admission_retry_after_s,
+)
+
+reports_limiter = ConcurrencyLimiter(
+    "reports",
+    max_concurrency=settings.reports_max_concurrency,
+    max_queue=settings.reports_max_queue,
+    queue_timeout_s=settings.admission_queue_timeout_s,
+    retry_after_s=settings.admission_retry_after_s,
+)
+
+limiters: Dict[str, ConcurrencyLimiter] = {
+    limiter.name: limiter for limiter in (export_limiter, tree_limiter, reports_limiter)
+}
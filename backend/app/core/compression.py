@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import gzip
+from typing import Callable, Dict, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.negotiation import parse_qvalues
+
+# Codec name -> compress(bytes) -> bytes, in order of preference for equal q.
+# brotli / zstandard are optional (pip install .[compression]); gzip is always available.
+_CODECS: Dict[str, Callable[[bytes], bytes]] = {}
+
+try:
+    import zstandard
+
+    _CODECS["zstd"] = lambda body: zstandard.ZstdCompressor(level=3).compress(body)
+except ImportError:
+    pass
+
+try:
+    import brotli
+
+    _CODECS["br"] = lambda body: brotli.compress(body, quality=4)
+except ImportError:
+    pass
+
+_CODECS["gzip"] = lambda body: gzip.compress(body, compresslevel=6)
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the available codec with the highest q the client accepts (q=0 means refused)."""
+    qvalues = parse_qvalues(accept_encoding)
+    best, best_q = None, 0.0
+    for name in _CODECS:
+        q = qvalues.get(name, qvalues.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Compresses complete (non-streaming) responses above `minimum_size`.
+
+    Bodies of `offload_size` bytes or more are compressed in a worker thread
+    so bulk pulls don't stall the event loop. Streaming responses (Excel
+    export, event streams) are passed through untouched: they are either
+    already compressed or must not be buffered.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, offload_size: int = 256 * 1024) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+
+        initial_message: Message = {}
+        started = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal initial_message, started
+            if message["type"] == "http.response.start":
+                # Hold the headers back until we know whether the body gets compressed
+                initial_message = message
+                return
+
+            if message["type"] != "http.response.body" or started:
+                await send(message)
+                return
+
+            started = True
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=initial_message["headers"])
+            if message.get("more_body", False) or "content-encoding" in headers:
+                await send(initial_message)
+                await send(message)
+                return
+
+            # Negotiated response: its representation depends on Accept-Encoding
+            headers.add_vary_header("Accept-Encoding")
+            if encoding is None or len(body) < self.minimum_size:
+                await send(initial_message)
+                await send(message)
+                return
+
+            compress = _CODECS[encoding]
+            if len(body) >= self.offload_size:
+                body = await anyio.to_thread.run_sync(compress, body)
+            else:
+                body = compress(body)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            await send(initial_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
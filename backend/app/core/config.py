@@ -3,6 +3,27 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     database_url: str
 
+    # Admission control for expensive endpoints (see app/core/admission.py)
+    export_max_concurrency: int = 2
+    export_max_queue: int = 4
+    tree_max_concurrency: int = 4
+    tree_max_queue: int = 8
+    reports_max_concurrency: int = 4
+    reports_max_queue: int = 8
+    admission_queue_timeout_s: float = 10.0
+    admission_retry_after_s: int = 5
+
+    # Responses smaller than this (bytes) are sent uncompressed
+    compression_minimum_size: int = 1024
+    # Bodies at least this large (bytes) are compressed off the event loop
+    compression_offload_size: int = 256 * 1024
+
+    # Server-sent change events (see app/core/events.py)
+    events_buffer_size: int = 1000
+    events_subscriber_queue_size: int = 100
+    events_keepalive_s: float = 15.0
+    events_reconnect_s: float = 2.0
+
     class Config:
         env_prefix = ""
         case_sensitive = False
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import signal
+import uuid
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+import psycopg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "component_events"
+
+
+def publish_event(db: Session, event_type: str, program_id: int, data: Dict[str, Any]) -> None:
+    """
+    Queue a change event on the current transaction.
+
+    Postgres only delivers NOTIFY on commit, so rolled-back changes never
+    produce events, and every worker's listener sees them in commit order.
+    """
+    payload = json.dumps({
+        "id": uuid.uuid4().hex,
+        "type": event_type,
+        "program_id": program_id,
+        "data": data,
+    })
+    db.execute(select(func.pg_notify(CHANNEL, payload)))
+
+
+class Subscription:
+    def __init__(self, program_id: Optional[int], queue_size: int) -> None:
+        self.program_id = program_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+    def wants(self, event: Dict[str, Any]) -> bool:
+        return self.program_id is None or event["program_id"] == self.program_id
+
+
+class EventBroker:
+    """
+    Per-process fan-out of change events to SSE subscribers.
+
+    A single LISTEN connection per worker receives every NOTIFY; the most
+    recent events are kept in a ring buffer so reconnecting clients can
+    resume from their Last-Event-ID. A subscriber that falls too far behind
+    is disconnected (it resumes from the buffer on reconnect).
+
+    `shutdown` is set as soon as the server is asked to exit, ending every
+    stream so uvicorn's connection drain doesn't wait on open tabs.
+    """
+
+    def __init__(self, buffer_size: int, queue_size: int) -> None:
+        self.buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.queue_size = queue_size
+        self.subscribers: Set[Subscription] = set()
+        self._task: Optional[asyncio.Task] = None
+        self.shutdown = asyncio.Event()
+
+    def subscribe(
+        self, program_id: Optional[int], last_event_id: Optional[str]
+    ) -> Tuple[Subscription, Optional[List[Dict[str, Any]]]]:
+        """
+        Register a subscriber and return it with the events it missed.
+
+        The backlog is None when `last_event_id` is no longer buffered, in
+        which case the client has to refetch its state.
+        """
+        sub = Subscription(program_id, self.queue_size)
+        backlog: Optional[List[Dict[str, Any]]] = []
+        if last_event_id:
+            ids = [event["id"] for event in self.buffer]
+            if last_event_id in ids:
+                missed = list(self.buffer)[ids.index(last_event_id) + 1:]
+                backlog = [event for event in missed if sub.wants(event)]
+            else:
+                backlog = None
+        self.subscribers.add(sub)
+        return sub, backlog
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        self.subscribers.discard(sub)
+
+    def dispatch(self, event: Dict[str, Any]) -> None:
+        self.buffer.append(event)
+        for sub in list(self.subscribers):
+            if not sub.wants(event):
+                continue
+            try:
+                sub.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Too slow: drop it and let the client resume from the buffer
+                self._disconnect(sub)
+
+    def _disconnect(self, sub: Subscription) -> None:
+        self.unsubscribe(sub)
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.queue.put_nowait(None)
+
+    async def _listen(self) -> None:
+        url = make_url(settings.database_url).set(drivername="postgresql")
+        conninfo = url.render_as_string(hide_password=False)
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    async for notify in conn.notifies():
+                        try:
+                            self.dispatch(json.loads(notify.payload))
+                        except (ValueError, KeyError):
+                            logger.warning("Ignoring malformed event payload: %r", notify.payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Event listener lost its connection, reconnecting")
+                # Events may have been missed: nothing buffered can be trusted for resume
+                self.buffer.clear()
+                for sub in list(self.subscribers):
+                    self._disconnect(sub)
+                await asyncio.sleep(settings.events_reconnect_s)
+
+    def begin_shutdown(self) -> None:
+        self.shutdown.set()
+        for sub in list(self.subscribers):
+            self._disconnect(sub)
+
+    def _install_exit_hook(self) -> None:
+        # uvicorn only starts draining connections after its SIGINT/SIGTERM
+        # handler runs, and waits for them before the lifespan shutdown, so
+        # chain onto that handler to end the streams first.
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            previous = signal.getsignal(sig)
+            if not callable(previous):
+                continue
+
+            def handler(signum, frame, previous=previous):
+                loop.call_soon_threadsafe(self.begin_shutdown)
+                previous(signum, frame)
+
+            try:
+                signal.signal(sig, handler)
+            except ValueError:
+                # Not on the main thread (e.g. TestClient): nothing to hook
+                return
+
+    def start(self) -> None:
+        if self._task is None:
+            self.shutdown.clear()
+            self._install_exit_hook()
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        self.begin_shutdown()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+broker = EventBroker(
+    buffer_size=settings.events_buffer_size,
+    queue_size=settings.events_subscriber_queue_size,
+)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from typing import Dict, Optional, Sequence
+
+
+def parse_qvalues(header: str) -> Dict[str, float]:
+    """Parse an Accept / Accept-Encoding style header into {token: q}."""
+    qvalues: Dict[str, float] = {}
+    for part in header.split(","):
+        token, *params = (p.strip() for p in part.split(";"))
+        token = token.lower()
+        if not token:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[token] = max(q, qvalues.get(token, 0.0))
+    return qvalues
+
+
+def choose_media_type(accept: Optional[str], offered: Sequence[str]) -> Optional[str]:
+    """
+    Pick the offered media type with the highest q in `accept`.
+
+    Exact matches beat `type/*`, which beats `*/*`. Ties go to the earliest
+    offer; the first offer is the default without an Accept header. Returns
+    None when nothing offered is acceptable.
+    """
+    if not accept:
+        return offered[0]
+
+    qvalues = parse_qvalues(accept)
+    best: Optional[str] = None
+    best_q = 0.0
+    for media_type in offered:
+        major = media_type.split("/", 1)[0]
+        for key in (media_type, f"{major}/*", "*/*"):
+            if key in qvalues:
+                q = qvalues[key]
+                break
+        else:
+            q = 0.0
+        if q > best_q:
+            best, best_q = media_type, q
+    return best
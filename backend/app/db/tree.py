@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from sqlalchemy import CTE, BigInteger, Integer, String, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, array
+
+from app.models.component import Component
+
+
+def assembly_paths_cte(program_id: int) -> CTE:
+    """
+    Top-down recursive CTE with one row per root-to-component path within a program.
+
+    Columns: id, name, part_number, quantity, effective_quantity (product of
+    quantities from the root down to and including this component), depth,
+    path_ids and path_names (root first).
+
+    Components caught in a parent cycle are never reached from a root and
+    therefore don't appear.
+    """
+    anchor = select(
+        Component.id,
+        Component.name,
+        Component.part_number,
+        Component.quantity,
+        cast(Component.quantity, BigInteger).label("effective_quantity"),
+        literal(0).label("depth"),
+        array([Component.id]).label("path_ids"),
+        cast(array([Component.name]), ARRAY(String)).label("path_names"),
+    ).where(Component.program_id == program_id, Component.parent_id.is_(None))
+
+    paths = anchor.cte("assembly_paths", recursive=True)
+
+    step = select(
+        Component.id,
+        Component.name,
+        Component.part_number,
+        Component.quantity,
+        (paths.c.effective_quantity * Component.quantity).label("effective_quantity"),
+        (paths.c.depth + 1).label("depth"),
+        paths.c.path_ids.op("||", return_type=ARRAY(Integer))(Component.id).label("path_ids"),
+        paths.c.path_names.op("||", return_type=ARRAY(String))(Component.name).label("path_names"),
+    ).join(paths, Component.parent_id == paths.c.id).where(Component.program_id == program_id)
+
+    return paths.union_all(step)
+
+
+def where_used_cte(program_id: int, part_number: str) -> CTE:
+    """
+    Recursive CTE walking from every component with `part_number` up to its root.
+
+    Starts from an index lookup on (program_id, part_number) instead of
+    building the whole tree. Rows whose `parent_id` is NULL have reached a
+    root; their path_ids / path_names are root first and effective_quantity
+    is the product of quantities along the path. A walk that revisits a
+    component (parent cycle) stops and never reaches a root.
+    """
+    anchor = select(
+        Component.id.label("component_id"),
+        Component.name,
+        Component.part_number,
+        Component.quantity,
+        Component.parent_id,
+        cast(Component.quantity, BigInteger).label("effective_quantity"),
+        array([Component.id]).label("path_ids"),
+        cast(array([Component.name]), ARRAY(String)).label("path_names"),
+    ).where(Component.program_id == program_id, Component.part_number == part_number)
+
+    walk = anchor.cte("where_used", recursive=True)
+
+    step = select(
+        walk.c.component_id,
+        walk.c.name,
+        walk.c.part_number,
+        walk.c.quantity,
+        Component.parent_id,
+        (walk.c.effective_quantity * Component.quantity).label("effective_quantity"),
+        array([Component.id]).op("||", return_type=ARRAY(Integer))(walk.c.path_ids).label("path_ids"),
+        cast(array([Component.name]), ARRAY(String)).op("||", return_type=ARRAY(String))(walk.c.path_names).label("path_names"),
+    ).join(walk, Component.id == walk.c.parent_id).where(
+        Component.program_id == program_id,
+        ~Component.id.op("=")(func.any(walk.c.path_ids)),
+    )
+
+    return walk.union_all(step)
@@ -1,9 +1,24 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.routes.components import router as components_router
+from app.api.routes.events import router as events_router
+from app.api.routes.programs import router as programs_router
 from app.api.routes.subsystems import router as subsystems_router
+from app.api.routes.reports import router as reports_router
+from app.core.admission import limiters
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.events import broker
 
-app = FastAPI(title="Satellite Components DB", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One LISTEN connection per worker feeds the /events stream
+    broker.start()
+    yield
+    await broker.stop()
+
+app = FastAPI(title="Satellite Components DB", version="0.1.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -12,10 +27,22 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    offload_size=settings.compression_offload_size,
+)
 
-app.include_router(components_router, prefix="/components", tags=["components"])
-app.include_router(subsystems_router, prefix="/subsystems", tags=["subsystems"])
+app.include_router(programs_router, prefix="/programs", tags=["programs"])
+app.include_router(components_router, prefix="/programs/{program_id}/components", tags=["components"])
+app.include_router(subsystems_router, prefix="/programs/{program_id}/subsystems", tags=["subsystems"])
+app.include_router(reports_router, prefix="/programs/{program_id}/reports", tags=["reports"])
+app.include_router(events_router, prefix="/events", tags=["events"])
 
 @app.get("/healthz")
-def healthz() -> dict:
+async def healthz() -> dict:
     return {"status": "ok"}
+
+@app.get("/healthz/admission")
+async def admission_stats() -> dict:
+    return {name: limiter.stats() for name, limiter in limiters.items()}
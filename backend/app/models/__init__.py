@@ -1,4 +1,5 @@
 from app.models.component import Component
+from app.models.program import Program
 from app.models.subsystem import Subsystem
 
 
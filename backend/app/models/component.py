@@ -1,20 +1,31 @@
 from __future__ import annotations
 
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import ForeignKey, String, Numeric, Integer
+from sqlalchemy import ForeignKey, Index, String, Numeric, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
 if TYPE_CHECKING:
+    from app.models.program import Program
     from app.models.subsystem import Subsystem
 
 class Component(Base):
     __tablename__ = "components"
+    __table_args__ = (
+        UniqueConstraint("program_id", "name", name="uq_components_program_id_name"),
+        Index("ix_components_parent_id_program_id", "parent_id", "program_id"),
+        Index("ix_components_program_id_part_number", "program_id", "part_number"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
 
-    name: Mapped[str] = mapped_column(String(200), nullable=False, unique=True)
+    program_id: Mapped[int] = mapped_column(
+        ForeignKey("programs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
     part_number: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     wbs: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     make_buy: Mapped[Optional[str]] = mapped_column(String(1), nullable=True)
@@ -39,6 +50,8 @@ class Component(Base):
         remote_side="Component.id",
     )
 
+    program: Mapped["Program"] = relationship(back_populates="components")
+
     subsystem: Mapped[Optional["Subsystem"]] = relationship(back_populates="components")
 
     children: Mapped[List["Component"]] = relationship(
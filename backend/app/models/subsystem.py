@@ -1,20 +1,29 @@
 from __future__ import annotations
 
 from typing import List, TYPE_CHECKING
-from sqlalchemy import String, Integer
+from sqlalchemy import ForeignKey, String, Integer, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
 
 if TYPE_CHECKING:
     from app.models.component import Component
+    from app.models.program import Program
 
 class Subsystem(Base):
     __tablename__ = "subsystems"
+    __table_args__ = (
+        UniqueConstraint("program_id", "name", name="uq_subsystems_program_id_name"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(String(200), nullable=False, unique=True)
-    
+    program_id: Mapped[int] = mapped_column(
+        ForeignKey("programs.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    name: Mapped[str] = mapped_column(String(200), nullable=False)
+
+    program: Mapped["Program"] = relationship(back_populates="subsystems")
     components: Mapped[List["Component"]] = relationship(back_populates="subsystem")
 
 
@@ -33,6 +33,7 @@ class ComponentUpdate(BaseModel):
 
 class ComponentOut(BaseModel):
     id: int
+    program_id: int
     name: str
     part_number: Optional[str]
     wbs: Optional[str]
@@ -0,0 +1,12 @@
+from __future__ import annotations
+from pydantic import BaseModel, Field
+
+class ProgramCreate(BaseModel):
+    name: str = Field(min_length=1, max_length=200)
+
+class ProgramOut(BaseModel):
+    id: int
+    name: str
+
+    class Config:
+        from_attributes = True
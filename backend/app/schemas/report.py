@@ -0,0 +1,20 @@
+from __future__ import annotations
+from typing import List
+from pydantic import BaseModel
+
+class PartUsage(BaseModel):
+    part_number: str
+    # Sum over every assembly path of the product of quantities along that path
+    total_quantity: int
+    # Number of components (i.e. assembly paths) carrying this part number
+    component_count: int
+
+class WhereUsed(BaseModel):
+    component_id: int
+    name: str
+    part_number: str
+    quantity: int
+    effective_quantity: int
+    # Root-first path of ancestors, ending with the component itself
+    path_ids: List[int]
+    path: List[str]
@@ -10,6 +10,7 @@ class SubsystemUpdate(BaseModel):
 
 class SubsystemOut(BaseModel):
     id: int
+    program_id: int
     name: str
 
     class Config:
@@ -12,7 +12,7 @@ from alembic import context
 
 
 from app.db.base import Base
-from app.models.component import Component  # noqa: F401 (import registers model)
+import app.models  # noqa: F401 (import registers models)
 
 config = context.config
 if config.config_file_name is not None:
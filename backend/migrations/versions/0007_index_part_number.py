@@ -0,0 +1,19 @@
+"""index part_number
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Supports part-number reports and where-used lookups
+    op.create_index("ix_components_part_number", "components", ["part_number"])
+
+def downgrade() -> None:
+    op.drop_index("ix_components_part_number", table_name="components")
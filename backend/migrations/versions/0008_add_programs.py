@@ -0,0 +1,66 @@
+"""add programs
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    op.create_table(
+        "programs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("name", sa.String(length=200), nullable=False, unique=True),
+    )
+
+    # Existing rows all belong to a single default program
+    op.execute("INSERT INTO programs (name) VALUES ('Default')")
+
+    for table in ("subsystems", "components"):
+        op.add_column(table, sa.Column("program_id", sa.Integer(), nullable=True))
+        op.execute(f"UPDATE {table} SET program_id = (SELECT id FROM programs WHERE name = 'Default')")
+        op.alter_column(table, "program_id", nullable=False)
+        op.create_foreign_key(
+            f"fk_{table}_program_id_programs",
+            table, "programs",
+            ["program_id"], ["id"],
+            ondelete="CASCADE"
+        )
+
+    # Names are unique per program rather than globally
+    op.drop_constraint("subsystems_name_key", "subsystems", type_="unique")
+    op.create_unique_constraint("uq_subsystems_program_id_name", "subsystems", ["program_id", "name"])
+    op.drop_constraint("components_name_key", "components", type_="unique")
+    op.create_unique_constraint("uq_components_program_id_name", "components", ["program_id", "name"])
+
+    # parent_id stays the leading column: the parent_id FK (ON DELETE SET NULL) and the
+    # ORM children load look children up by parent_id alone
+    op.drop_index("ix_components_parent_id", table_name="components")
+    op.create_index("ix_components_parent_id_program_id", "components", ["parent_id", "program_id"])
+    # Program-leading so a single vehicle's part-number lookups only touch its own rows
+    op.drop_index("ix_components_part_number", table_name="components")
+    op.create_index("ix_components_program_id_part_number", "components", ["program_id", "part_number"])
+
+def downgrade() -> None:
+    op.drop_index("ix_components_program_id_part_number", table_name="components")
+    op.create_index("ix_components_part_number", "components", ["part_number"])
+    op.drop_index("ix_components_parent_id_program_id", table_name="components")
+    op.create_index("ix_components_parent_id", "components", ["parent_id"])
+
+    # Restoring global uniqueness fails if names have been reused across programs
+    op.drop_constraint("uq_components_program_id_name", "components", type_="unique")
+    op.create_unique_constraint("components_name_key", "components", ["name"])
+    op.drop_constraint("uq_subsystems_program_id_name", "subsystems", type_="unique")
+    op.create_unique_constraint("subsystems_name_key", "subsystems", ["name"])
+
+    for table in ("components", "subsystems"):
+        op.drop_constraint(f"fk_{table}_program_id_programs", table, type_="foreignkey")
+        op.drop_column(table, "program_id")
+
+    op.drop_table("programs")
@@ -1,10 +1,39 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect } from 'react';
+import api from './api';
 import ComponentList from './components/ComponentList';
 import AddComponentForm from './components/AddComponentForm';
 import SubsystemManager from './components/SubsystemManager';
 
 function App() {
   const [refreshTrigger, setRefreshTrigger] = useState(0);
+  const [programs, setPrograms] = useState([]);
+  const [programId, setProgramId] = useState(null);
+
+  useEffect(() => {
+    const fetchPrograms = async () => {
+      try {
+        const response = await api.get('/programs');
+        setPrograms(response.data);
+        if (response.data.length > 0) {
+          setProgramId(response.data[0].id);
+        }
+      } catch (err) {
+        console.error("Error fetching programs:", err);
+      }
+    };
+    fetchPrograms();
+  }, []);
+
+  // Keep the selection on a program that still exists
+  useEffect(() => {
+    if (programId !== null && !programs.some(p => p.id === programId)) {
+      setProgramId(programs.length > 0 ? programs[0].id : null);
+    }
+  }, [programs, programId]);
+
+  const handleProgramDeleted = (id) => {
+    setPrograms(prev => prev.filter(p => p.id !== id));
+  };
 
   const handleAddSuccess = () => {
     setRefreshTrigger(prev => prev + 1);
@@ -16,20 +45,36 @@ function App() {
         <h1 className="text-3xl font-bold text-gray-900 dark:text-white mb-8 text-center">
           Satellite Components Database
         </h1>
-        
-        <div className="grid grid-cols-1 lg:grid-cols-3 gap-8">
-          <div className="lg:col-span-2">
-            <h2 className="text-xl font-semibold text-gray-800 dark:text-gray-200 mb-4">Component List</h2>
-            <ComponentList refreshTrigger={refreshTrigger} />
-          </div>
-          
-          <div>
-            <h2 className="text-xl font-semibold text-gray-800 dark:text-gray-200 mb-4">Add Component</h2>
-            <AddComponentForm onAddSuccess={handleAddSuccess} />
-            
-            <SubsystemManager />
-          </div>
+
+        <div className="flex justify-center items-center gap-2 mb-8">
+          <label htmlFor="program" className="text-gray-800 dark:text-gray-200 font-medium">Program</label>
+          <select
+            id="program"
+            value={programId ?? ''}
+            onChange={e => setProgramId(parseInt(e.target.value, 10))}
+            className="rounded-md border-gray-300 shadow-sm focus:border-indigo-500 focus:ring-indigo-500 dark:bg-gray-700 dark:border-gray-600 dark:text-white p-2 border"
+          >
+            {programs.map(p => (
+              <option key={p.id} value={p.id}>{p.name}</option>
+            ))}
+          </select>
         </div>
+
+        {programId !== null && (
+          <div className="grid grid-cols-1 lg:grid-cols-3 gap-8">
+            <div className="lg:col-span-2">
+              <h2 className="text-xl font-semibold text-gray-800 dark:text-gray-200 mb-4">Component List</h2>
+              <ComponentList programId={programId} refreshTrigger={refreshTrigger} onProgramDeleted={handleProgramDeleted} />
+            </div>
+
+            <div>
+              <h2 className="text-xl font-semibold text-gray-800 dark:text-gray-200 mb-4">Add Component</h2>
+              <AddComponentForm programId={programId} onAddSuccess={handleAddSuccess} />
+
+              <SubsystemManager programId={programId} />
+            </div>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -2,7 +2,7 @@ import axios from 'axios';
 
 // Ensure the API URL is configurable via environment variables
 // VITE_ prefix is required for Vite to expose env vars to the client
-const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
+export const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
 const api = axios.create({
     baseURL: API_URL,
@@ -1,7 +1,7 @@
 import React, { useState } from 'react';
 import api from '../api';
 
-const AddComponentForm = ({ onAddSuccess }) => {
+const AddComponentForm = ({ programId, onAddSuccess }) => {
     const [formData, setFormData] = useState({
         name: '',
         part_number: '',
@@ -20,14 +20,14 @@ const AddComponentForm = ({ onAddSuccess }) => {
     React.useEffect(() => {
         const fetchSubsystems = async () => {
             try {
-                const response = await api.get('/subsystems');
+                const response = await api.get(`/programs/${programId}/subsystems`);
                 setSubsystems(response.data);
             } catch (err) {
                 console.error("Error fetching subsystems:", err);
             }
         };
         fetchSubsystems();
-    }, []);
+    }, [programId]);
 
     const handleChange = (e) => {
         const { name, value } = e.target;
@@ -55,7 +55,7 @@ const AddComponentForm = ({ onAddSuccess }) => {
         };
 
         try {
-            await api.post('/components', payload);
+            await api.post(`/programs/${programId}/components`, payload);
             setFormData({
                 name: '',
                 part_number: '',
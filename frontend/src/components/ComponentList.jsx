@@ -1,13 +1,16 @@
-import React, { useEffect, useState, useMemo } from 'react';
-import api from '../api';
+import React, { useEffect, useState, useMemo, useRef } from 'react';
+import api, { API_URL } from '../api';
 
-const ComponentList = ({ refreshTrigger }) => {
+const ComponentList = ({ programId, refreshTrigger, onProgramDeleted }) => {
     const [components, setComponents] = useState([]);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
     const [editingId, setEditingId] = useState(null);
     const [editFormData, setEditFormData] = useState({});
     const [subsystems, setSubsystems] = useState([]);
+    // Live-update state for the current program: events that arrive while a
+    // fetch is in flight are queued and replayed on top of its snapshot
+    const liveRef = useRef(null);
 
     const sortedComponents = useMemo(() => {
         if (!components || components.length === 0) return [];
@@ -63,25 +66,31 @@ const ComponentList = ({ refreshTrigger }) => {
     useEffect(() => {
         const fetchSubsystems = async () => {
             try {
-                const response = await api.get('/subsystems');
+                const response = await api.get(`/programs/${programId}/subsystems`);
                 setSubsystems(response.data);
             } catch (err) {
                 console.error("Error fetching subsystems:", err);
             }
         };
         fetchSubsystems();
-    }, []);
+    }, [programId]);
 
     const fetchComponents = async () => {
+        const live = liveRef.current;
+        const missed = [];
+        live?.queues.add(missed);
         try {
-            setLoading(true);
-            const response = await api.get('/components');
-            setComponents(response.data);
+            const response = await api.get(`/programs/${programId}/components`);
+            // Ignore responses for a program we've since switched away from
+            if (liveRef.current !== live) return;
+            setComponents(missed.reduce((acc, update) => update(acc), response.data));
+            if (live) live.loaded = true;
             setError(null);
         } catch (err) {
             console.error("Error fetching components:", err);
             setError("Failed to fetch components.");
         } finally {
+            live?.queues.delete(missed);
             setLoading(false);
         }
     };
@@ -92,7 +101,7 @@ const ComponentList = ({ refreshTrigger }) => {
         }
 
         try {
-            await api.delete(`/components/${id}`);
+            await api.delete(`/programs/${programId}/components/${id}`);
             // Optimistic update or refetch
             setComponents(prev => prev.filter(c => c.id !== id));
         } catch (err) {
@@ -143,7 +152,7 @@ const ComponentList = ({ refreshTrigger }) => {
                 subsystem_id: (editFormData.subsystem_id === '' || editFormData.subsystem_id === null) ? null : parseInt(editFormData.subsystem_id, 10),
             };
 
-            await api.patch(`/components/${id}`, payload);
+            await api.patch(`/programs/${programId}/components/${id}`, payload);
             
             // Update local state with the new values
             setComponents(prev => prev.map(c => c.id === id ? { ...c, ...payload } : c));
@@ -158,7 +167,7 @@ const ComponentList = ({ refreshTrigger }) => {
 
     const handleExport = async () => {
         try {
-            const response = await api.get('/components/export/excel', {
+            const response = await api.get(`/programs/${programId}/components/export/excel`, {
                 responseType: 'blob',
             });
             const url = window.URL.createObjectURL(new Blob([response.data]));
@@ -174,10 +183,85 @@ const ComponentList = ({ refreshTrigger }) => {
         }
     };
 
+    // Our own creates arrive as component.created events; only refetch when
+    // the stream isn't connected to deliver them
     useEffect(() => {
-        fetchComponents();
+        const live = liveRef.current;
+        if (refreshTrigger > 0 && live?.source.readyState !== EventSource.OPEN) fetchComponents();
     }, [refreshTrigger]);
 
+    // Live updates from other tabs/users via server-sent events. The stream is
+    // opened before the list is fetched so nothing committed in between is lost;
+    // replayed events are harmless because applying them is idempotent. The list
+    // is fetched once per program, and again only on `reset`.
+    useEffect(() => {
+        const source = new EventSource(`${API_URL}/events?program_id=${programId}`);
+        const live = { source, queues: new Set(), loaded: false };
+        liveRef.current = live;
+        setComponents([]);
+        setLoading(true);
+
+        const apply = (update) => {
+            setComponents(update);
+            live.queues.forEach(queue => queue.push(update));
+        };
+
+        const upsert = (e) => {
+            const data = JSON.parse(e.data);
+            apply(prev => {
+                const existing = prev.find(c => c.id === data.id);
+                if (existing) {
+                    return prev.map(c => c.id === data.id ? { ...c, ...data } : c);
+                }
+                return [...prev, data];
+            });
+        };
+        const remove = (e) => {
+            const { id } = JSON.parse(e.data);
+            // Children are re-parented to the root on the server
+            apply(prev => prev
+                .filter(c => c.id !== id)
+                .map(c => c.parent_id === id ? { ...c, parent_id: null } : c));
+        };
+        const refreshSubsystems = async () => {
+            const response = await api.get(`/programs/${programId}/subsystems`);
+            setSubsystems(response.data);
+        };
+
+        source.addEventListener('component.created', upsert);
+        source.addEventListener('component.updated', upsert);
+        source.addEventListener('component.deleted', remove);
+        source.addEventListener('subsystem.created', refreshSubsystems);
+        source.addEventListener('subsystem.deleted', (e) => {
+            const { id } = JSON.parse(e.data);
+            apply(prev => prev.map(c => c.subsystem_id === id ? { ...c, subsystem_id: null } : c));
+            refreshSubsystems();
+        });
+        // Its components and subsystems were deleted with it
+        source.addEventListener('program.deleted', () => {
+            live.loaded = true;
+            apply(() => []);
+            setSubsystems([]);
+            if (onProgramDeleted) onProgramDeleted(programId);
+        });
+        // The server couldn't replay what we missed: fall back to a full refetch
+        source.addEventListener('reset', () => fetchComponents());
+        // Subscribed: take the initial snapshot. Reconnects resume from
+        // Last-Event-ID instead (or get a `reset` if that's not possible)
+        source.addEventListener('open', () => {
+            if (!live.loaded) fetchComponents();
+        });
+        // Stream unavailable: still show the list
+        source.addEventListener('error', () => {
+            if (!live.loaded) fetchComponents();
+        });
+
+        return () => {
+            source.close();
+            if (liveRef.current === live) liveRef.current = null;
+        };
+    }, [programId]);
+
     if (loading) return <div className="text-center p-4">Loading...</div>;
     if (error) return <div className="text-red-500 p-4">{error}</div>;
 
@@ -350,7 +434,7 @@ const ComponentList = ({ refreshTrigger }) => {
                                             <td className="px-6 py-4">{comp.cost_usd}</td>
                                             <td className="px-6 py-4">{comp.quantity}</td>
                                             <td className="px-6 py-4">{comp.parent_id || '-'}</td>
-                                            <td className="px-6 py-4">{comp.subsystem ? comp.subsystem.name : '-'}</td>
+                                            <td className="px-6 py-4">{subsystems.find(s => s.id === comp.subsystem_id)?.name || '-'}</td>
                                             <td className="px-6 py-4 space-x-2">
                                                 <button
                                                     onClick={() => handleEditClick(comp)}
@@ -1,14 +1,14 @@
 import React, { useState, useEffect } from 'react';
 import api from '../api';
 
-const SubsystemManager = () => {
+const SubsystemManager = ({ programId }) => {
     const [subsystems, setSubsystems] = useState([]);
     const [name, setName] = useState('');
     const [error, setError] = useState(null);
 
     const fetchSubsystems = async () => {
         try {
-            const res = await api.get('/subsystems');
+            const res = await api.get(`/programs/${programId}/subsystems`);
             setSubsystems(res.data);
             setError(null);
         } catch (err) {
@@ -18,12 +18,12 @@ const SubsystemManager = () => {
 
     useEffect(() => {
         fetchSubsystems();
-    }, []);
+    }, [programId]);
 
     const handleAdd = async (e) => {
         e.preventDefault();
         try {
-            await api.post('/subsystems', { name });
+            await api.post(`/programs/${programId}/subsystems`, { name });
             setName('');
             fetchSubsystems();
         } catch (err) {
@@ -34,7 +34,7 @@ const SubsystemManager = () => {
     const handleDelete = async (id) => {
         if (!window.confirm("Delete subsystem?")) return;
         try {
-            await api.delete(`/subsystems/${id}`);
+            await api.delete(`/programs/${programId}/subsystems/${id}`);
             fetchSubsystems();
         } catch (err) {
              setError(err.response?.data?.detail || "Failed to delete subsystem");